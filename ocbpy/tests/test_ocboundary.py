@@ -8,6 +8,8 @@
 
 import ocbpy
 import unittest
+import numpy as np
+import datetime as dt
 
 class TestOCBoundaryMethods(unittest.TestCase):
 
@@ -66,8 +68,6 @@ class TestOCBoundaryMethods(unittest.TestCase):
     def test_partial_load(self):
         """ Ensure limited sections of a file can be loaded
         """
-        import datetime as dt
-
         stime = self.ocb.dtime[0] + dt.timedelta(seconds=1)
         etime = self.ocb.dtime[-1] - dt.timedelta(seconds=1)
 
@@ -133,9 +133,6 @@ class TestOCBoundaryMethods(unittest.TestCase):
     def test_match(self):
         """ Test to see that the data matching works properly
         """
-        import numpy as np
-        import datetime as dt
-    
         # Build a array of times for a test dataset
         self.ocb.rec_ind = 27
         test_times = np.arange(self.ocb.dtime[self.ocb.rec_ind],
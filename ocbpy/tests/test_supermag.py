@@ -11,22 +11,28 @@ import numpy as np
 
 class TestSuperMAGMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file, as well as
-        the VectorData object
+    @classmethod
+    def setUpClass(cls):
+        """ Initialize the read-only test file names once for the class
         """
         from os import path
         import ocbpy
-        
-        self.ocb_dir = path.split(ocbpy.__file__)[0]
-        self.test_ocb = path.join(self.ocb_dir, "tests", "test_data",
-                                  "test_north_circle")
-        self.test_file = path.join(self.ocb_dir, "tests", "test_data",
-                                   "test_smag")
-        self.test_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "out_smag")
-        self.temp_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "temp_smag")
+
+        cls.ocb_dir = path.split(ocbpy.__file__)[0]
+        cls.test_ocb = path.join(cls.ocb_dir, "tests", "test_data",
+                                 "test_north_circle")
+        cls.test_file = path.join(cls.ocb_dir, "tests", "test_data",
+                                  "test_smag")
+        cls.test_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "out_smag")
+        cls.temp_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "temp_smag")
+
+    def setUp(self):
+        """ Ensure the test file is available
+        """
+        from os import path
+
         self.assertTrue(path.isfile(self.test_file))
 
     def tearDown(self):
@@ -35,8 +41,6 @@ class TestSuperMAGMethods(unittest.TestCase):
         if os.path.isfile(self.temp_output):
             os.remove(self.temp_output)
 
-        del self.test_file, self.test_output, self.test_ocb, self.temp_output
-
     def test_load_supermag_ascii_data(self):
         """ Test the routine to load the SuperMAG data
         """
@@ -109,9 +113,8 @@ class TestSuperMAGMethods(unittest.TestCase):
             # Test the number of rows and columns
             self.assertTupleEqual(test_out.shape, temp_out.shape)
 
-            # Test the data in each row
-            for i,test_row in enumerate(test_out):
-                self.assertListEqual(list(test_row), list(temp_out[i]))
+            # Test the data in all rows at once
+            np.testing.assert_array_equal(test_out, temp_out)
 
             del ldtype, test_out, temp_out
         else:
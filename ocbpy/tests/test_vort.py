@@ -12,25 +12,32 @@ import datetime as dt
 
 class TestVortMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file, as well as
-        the VectorData object
+    @classmethod
+    def setUpClass(cls):
+        """ Initialize the read-only test file names and expected values once
+        for the class
         """
         from os import path
         import ocbpy
-        
-        self.ocb_dir = path.split(ocbpy.__file__)[0] 
-        self.test_ocb = path.join(self.ocb_dir, "tests", "test_data",
-                                  "test_north_circle")
-        self.test_file = path.join(self.ocb_dir, "tests", "test_data",
-                                   "test_vort")
-        self.test_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "out_vort")
-        self.temp_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "temp_vort")
-        self.test_vals = {'CENTRE_MLAT':67.27, 'DAY':5, 'MLT':3.127,
-                          'UTH':13.65, 'VORTICITY':0.0020967, 'YEAR':2000,
-                          'DATETIME':dt.datetime(2000,5,5,13,39,00), 'MONTH':5}
+
+        cls.ocb_dir = path.split(ocbpy.__file__)[0]
+        cls.test_ocb = path.join(cls.ocb_dir, "tests", "test_data",
+                                 "test_north_circle")
+        cls.test_file = path.join(cls.ocb_dir, "tests", "test_data",
+                                  "test_vort")
+        cls.test_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "out_vort")
+        cls.temp_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "temp_vort")
+        cls.test_vals = {'CENTRE_MLAT':67.27, 'DAY':5, 'MLT':3.127,
+                         'UTH':13.65, 'VORTICITY':0.0020967, 'YEAR':2000,
+                         'DATETIME':dt.datetime(2000,5,5,13,39,00), 'MONTH':5}
+
+    def setUp(self):
+        """ Ensure the test file is available
+        """
+        from os import path
+
         self.assertTrue(path.isfile(self.test_file))
 
     def tearDown(self):
@@ -39,8 +46,6 @@ class TestVortMethods(unittest.TestCase):
         if os.path.isfile(self.temp_output):
             os.remove(self.temp_output)
 
-        del self.test_file, self.test_output, self.test_ocb, self.temp_output
-
     def test_load_vort_data(self):
         """ Test the routine to load the SuperDARN vorticity data
         """
@@ -116,9 +121,8 @@ class TestVortMethods(unittest.TestCase):
             # Test the number of rows and columns
             self.assertTupleEqual(test_out.shape, temp_out.shape)
 
-            # Test the data in each row
-            for i,test_row in enumerate(test_out):
-                self.assertListEqual(list(test_row), list(temp_out[i]))
+            # Test the data in all rows at once
+            np.testing.assert_array_equal(test_out, temp_out)
 
             del ldtype, test_out, temp_out
         else: